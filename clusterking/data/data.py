@@ -111,8 +111,8 @@ class Data(DFMD):
         """
         data = self.df[self.bin_cols].values
         if normalize:
-            # Reshaping here is important!
-            return data / np.sum(data, axis=1).reshape((self.n, 1))
+            # Keeping the summed axis is important for correct broadcasting!
+            return data / np.sum(data, axis=1, keepdims=True)
         else:
             return data
 
@@ -7,7 +7,6 @@ from typing import List, Optional, Dict, Any
 # ours
 from clusterking.data.data import Data
 from clusterking.maths.statistics import (
-    cov2err,
     cov2corr,
     abs2rel_cov,
     corr2cov,
@@ -197,6 +196,23 @@ class DataWithErrors(Data):
     # Actual calculations
     # **************************************************************************
 
+    def _var(self, data: np.ndarray) -> np.ndarray:
+        """Return the variances, i.e. the diagonal of the covariance matrix
+        (see :meth:`cov`). This avoids building the full
+        ``self.n x self.nbins x self.nbins`` covariance array.
+
+        Args:
+            data: ``self.n x self.nbins`` array as returned by :meth:`data`
+
+        Returns:
+            ``self.n x self.nbins`` array
+        """
+        var = np.diag(self.abs_cov) + np.diag(self.rel_cov) * np.square(data)
+        if self.poisson_errors:
+            # See the explanation in cov
+            var += data / self.poisson_errors_scale
+        return var
+
     def cov(self, relative=False) -> np.ndarray:
         """Return covariance matrix :math:`\\mathrm{Cov}(d^{(n)}_i, d^{(n)}_j)`
 
@@ -213,20 +229,19 @@ class DataWithErrors(Data):
 
         data = self.data()
         cov = np.tile(self.abs_cov, (self.n, 1, 1))
-        cov += np.einsum("ij,ki,kj->kij", self.rel_cov, data, data)
+        cov += self.rel_cov * data[:, :, np.newaxis] * data[:, np.newaxis, :]
         if self.poisson_errors:
-            cov += corr2cov(
-                np.tile(np.eye(self.nbins), (self.n, 1, 1)),
-                # Normal poisson errors are sqrt(data_i). What happens if
-                # data is normalized from N to N', i.e.
-                #   Sum(data_normalized) = N'?
-                # Let N/N' = scale
-                # Then the errors should be
-                #   sqrt(data) / scale = sqrt(data/scale) / sqrt(scale) =
-                #   = sqrt(data_normalized) / sqrt(scale)
-                # Hence:
-                np.sqrt(data) / np.sqrt(self.poisson_errors_scale),
-            )
+            # Normal poisson errors are sqrt(data_i). What happens if
+            # data is normalized from N to N', i.e.
+            #   Sum(data_normalized) = N'?
+            # Let N/N' = scale
+            # Then the errors should be
+            #   sqrt(data) / scale = sqrt(data/scale) / sqrt(scale) =
+            #   = sqrt(data_normalized) / sqrt(scale)
+            # Poisson errors are uncorrelated, so we only need to add the
+            # squared errors to the diagonal:
+            bins = np.arange(self.nbins)
+            cov[:, bins, bins] += data / self.poisson_errors_scale
 
         if not relative:
             return cov
@@ -240,9 +255,10 @@ class DataWithErrors(Data):
         Returns:
             ``self.n x self.nbins x self.nbins`` array
         """
-        if np.sum(np.abs(self.cov())) == 0.0:
+        cov = self.cov()
+        if not cov.any():
             return np.tile(np.eye(self.nbins), (self.n, 1, 1))
-        return cov2corr(self.cov())
+        return cov2corr(cov)
 
     def err(self, relative=False) -> np.ndarray:
         """Return errors per bin, i.e.
@@ -254,10 +270,12 @@ class DataWithErrors(Data):
         Returns:
             ``self.n x self.nbins`` array
         """
+        data = self.data()
+        err = np.sqrt(self._var(data))
         if not relative:
-            return cov2err(self.cov())
+            return err
         else:
-            return cov2err(self.cov()) / self.data()
+            return err / data
 
     # **************************************************************************
     # Configuration
@@ -311,8 +329,7 @@ class DataWithErrors(Data):
             err: see argument of :py:meth:`.add_err_corr`
         """
         err = self._interpret_input(err, "err")
-        corr = np.identity(self.nbins)
-        self.add_err_corr(err, corr)
+        self.add_err_cov(np.diag(np.square(err)))
 
     def add_err_maxcorr(self, err) -> None:
         """
@@ -361,8 +378,7 @@ class DataWithErrors(Data):
                 :py:meth:`.add_err_corr`
         """
         err = self._interpret_input(err, "err")
-        corr = np.identity(self.nbins)
-        self.add_rel_err_corr(err, corr)
+        self.add_rel_err_cov(np.diag(np.square(err)))
 
     def add_rel_err_maxcorr(self, err) -> None:
         """
@@ -10,6 +10,7 @@ import numpy as np
 # ours
 from clusterking.util.testing import MyTestCase
 from clusterking.data.dwe import DataWithErrors
+from clusterking.maths.statistics import cov2err
 
 
 class TestDataWithErrors(MyTestCase):
@@ -112,7 +113,19 @@ class TestDataWithErrors(MyTestCase):
         self.assertAllClose(dwe.corr(), np.ones((2, 2, 2)))
         self.assertAllClose(dwe.err(), err)
 
-    # todo: test rel_err
+    def test_add_rel_err_uncorr(self):
+        dwe = self.ndwe()
+        dwe.add_rel_err_uncorr(0.1)
+        self.assertAllClose(dwe.corr(), np.identity(2))
+        self.assertAllClose(dwe.err(), 0.1 * np.array(self.data))
+
+        dwe = self.ndwe()
+        err = [0.1, 0.2]
+        dwe.add_rel_err_uncorr(err)
+        self.assertAllClose(dwe.corr(), np.identity(2))
+        self.assertAllClose(dwe.err(), err * np.array(self.data))
+
+    # todo: test other rel_err
 
     # --------------------------------------------------------------------------
 
@@ -134,6 +147,23 @@ class TestDataWithErrors(MyTestCase):
         rel_err2 = dwe2.err(relative=True)
         self.assertAllClose(rel_err1, rel_err2 * 2)
 
+    def test_cov_relative(self):
+        dwe = self.ndwe()
+        rel_cov = [[0.04, 0.01], [0.01, 0.09]]
+        dwe.add_rel_err_cov(rel_cov)
+        self.assertAllClose(dwe.cov(relative=True), [rel_cov, rel_cov])
+        data = np.array(self.data)
+        self.assertAllClose(
+            dwe.cov(), np.array(rel_cov) * np.einsum("ki,kj->kij", data, data)
+        )
+
+    def test_err_consistent_with_cov(self):
+        dwe = self.ndwe()
+        dwe.add_err_corr([1.52, 2.34], [[1.0, 0.32], [0.4, 1.0]])
+        dwe.add_rel_err_maxcorr(0.1)
+        dwe.add_err_poisson(normalization_scale=4)
+        self.assertAllClose(dwe.err(), cov2err(dwe.cov()))
+
     # --------------------------------------------------------------------------
     def test_plot_dist_err(self):
         self.dwe.plot_dist_err()
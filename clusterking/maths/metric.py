@@ -2,9 +2,11 @@
 
 # 3rd
 import numpy as np
+import scipy.linalg
+import scipy.spatial
 
 # ours
-from clusterking.maths.metric_utils import condense_distance_matrix
+from clusterking.maths.metric_utils import uncondense_distance_matrix
 from clusterking.data.dwe import DataWithErrors
 
 
@@ -57,10 +59,14 @@ def chi2(
         cov2 = cov2.copy() / np.square(norm2).reshape((norm2.size, 1, 1))
     diff = n1 - n2
     cov = cov1 + cov2
+    # Solving the linear system is faster and numerically more stable than
+    # explicitly inverting the covariance matrix.
     if cov.ndim == 3:
-        return np.einsum("ni,nij,nj->n", diff, np.linalg.inv(cov), diff)
+        cov_inv_diff = np.linalg.solve(cov, diff[..., np.newaxis])[..., 0]
+        return np.einsum("ni,ni->n", diff, cov_inv_diff)
     elif cov.ndim == 2:
-        return np.einsum("ni,ij,nj->n", diff, np.linalg.inv(cov), diff)
+        cov_inv_diff = np.linalg.solve(cov, diff.T)
+        return np.einsum("ni,in->n", diff, cov_inv_diff)
     else:
         raise ValueError(
             "Invalid dimensionality of covariance matrix."
@@ -69,8 +75,55 @@ def chi2(
         )
 
 
-# todo: unittest
-def chi2_metric(dwe: DataWithErrors, output="condensed"):
+def _chi2_pairs(
+    d: np.ndarray,
+    cov: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    chunk_size: int,
+) -> np.ndarray:
+    """Chi2 values for pairs of histograms. Rather than looping over pairs
+    in python, we evaluate fixed size chunks of pairs, each with one batched
+    call to numpy.linalg. The working arrays are allocated once and reused
+    for every chunk.
+
+    Args:
+        d: n_obs x n_bins
+        cov: n_obs x n_bins x n_bins
+        rows: Indices of the first histogram of each pair
+        cols: Indices of the second histogram of each pair
+        chunk_size: Number of pairs per chunk
+
+    Returns:
+        Vector of chi2 values (degrees of freedom not yet divided out)
+    """
+    n_bins = d.shape[1]
+    ret = np.empty(len(rows), dtype=d.dtype)
+    size = min(chunk_size, len(rows))
+    diff = np.empty((size, n_bins), dtype=d.dtype)
+    d_cols = np.empty((size, n_bins), dtype=d.dtype)
+    cov_sum = np.empty((size, n_bins, n_bins), dtype=cov.dtype)
+    cov_cols = np.empty((size, n_bins, n_bins), dtype=cov.dtype)
+    for start in range(0, len(rows), chunk_size):
+        i = rows[start : start + chunk_size]
+        j = cols[start : start + chunk_size]
+        m = len(i)
+        np.take(d, i, axis=0, out=diff[:m])
+        np.take(d, j, axis=0, out=d_cols[:m])
+        diff[:m] -= d_cols[:m]
+        np.take(cov, i, axis=0, out=cov_sum[:m])
+        np.take(cov, j, axis=0, out=cov_cols[:m])
+        cov_sum[:m] += cov_cols[:m]
+        cov_inv_diff = np.linalg.solve(cov_sum[:m], diff[:m, :, np.newaxis])
+        ret[start : start + m] = np.einsum(
+            "ni,ni->n", diff[:m], cov_inv_diff[..., 0]
+        )
+    return ret
+
+
+def chi2_metric(
+    dwe: DataWithErrors, output="condensed", chunk_size=5000, dtype=np.float64
+):
     """
     Returns the chi2/ndf values of the comparison of a datasets.
 
@@ -78,6 +131,14 @@ def chi2_metric(dwe: DataWithErrors, output="condensed"):
         dwe: :py:class:`clusterking.data.dwe.DataWithErrors` object
         output: 'condensed' (condensed distance matrix) or 'full' (full distance
             matrix)
+        chunk_size: Number of pairs of distributions that are compared in
+            one vectorized step. Memory usage scales with
+            ``chunk_size * nbins * nbins``. Not used if all distributions
+            share the same covariance matrix.
+        dtype: Floating point type used for the calculation. Using
+            ``numpy.float32`` halves memory usage and is faster, but the
+            reduced precision might not be adequate for distributions with
+            small uncertainties.
 
     Returns:
         Condensed distance matrix or full distance matrix
@@ -96,21 +157,46 @@ def chi2_metric(dwe: DataWithErrors, output="condensed"):
     cov = dwe.cov(relative=False)
     assert cov.shape == (n_obs, n_bins, n_bins)
 
-    # n x n
-    chi2s = np.full((n_obs, n_obs), np.nan)
-    # todo: this calculates the full n x n matrix, even though it's symmetric
-    #    so we could likely optimize this if we wanted
-    for i in range(n_obs):
-        chi2s[i, :] = chi2(d, d[i], cov, cov[i], normalize=True)
-
-    # todo: check for symmetry and vanishing diagonal of matrix here
+    # Normalize once for all histograms rather than once per row (which is
+    # what calling chi2 with normalize=True would do): This avoids
+    # re-allocating several n x nbins x nbins temporaries in every iteration.
+    # The data array we get from pandas is usually column major (bin after
+    # bin), but below we gather complete distributions, so we directly
+    # write the normalized data in row major order, such that the bins of
+    # each distribution are contiguous in memory.
+    norms = d.sum(axis=1)
+    d = np.divide(d, norms[:, np.newaxis], order="C", dtype=dtype)
+    cov = cov / np.square(norms).reshape((n_obs, 1, 1))
+    # Do all distributions share the same covariance matrix (e.g. only
+    # absolute errors on distributions with equal normalization)?
+    # The reduction over the first axis avoids n x nbins x nbins temporaries.
+    shared_cov = np.all(np.ptp(cov, axis=0) <= 1e-10 * np.abs(cov[0]))
+    cov = np.ascontiguousarray(cov, dtype=dtype)
+
+    # The chi2 matrix is symmetric with vanishing diagonal, so we only
+    # calculate the upper triangle and directly fill the condensed distance
+    # vector (same ordering as scipy's squareform).
+    if shared_cov:
+        # With the Cholesky decomposition 2 C = L L^T of the summed
+        # covariance matrix, the chi2 is the squared euclidean distance of
+        # the whitened distributions y = L^-1 d:
+        #   chi2(i, j) = (d_i - d_j)^T (2 C)^-1 (d_i - d_j) = |y_i - y_j|^2
+        chol = np.linalg.cholesky(2 * cov[0])
+        y = scipy.linalg.solve_triangular(chol, d.T, lower=True).T
+        # pdist always calculates in double precision
+        chi2s = scipy.spatial.distance.pdist(y, "sqeuclidean").astype(
+            dtype, copy=False
+        )
+    else:
+        rows, cols = np.triu_indices(n_obs, k=1)
+        chi2s = _chi2_pairs(d, cov, rows, cols, chunk_size=chunk_size)
 
     ndf = n_bins - 1
-    chi2ndf = chi2s / np.full((1, 1), ndf)
+    chi2ndf = chi2s / ndf
 
     if output == "condensed":
-        return condense_distance_matrix(chi2ndf)
-    elif output == "full":
         return chi2ndf
+    elif output == "full":
+        return uncondense_distance_matrix(chi2ndf)
     else:
         raise ValueError("Unknown argument '{}'.".format(output))
@@ -23,11 +23,19 @@ def condense_distance_matrix(matrix):
         n choose 2 vector
     """
     assert matrix.ndim == 2
+    assert matrix.shape[0] == matrix.shape[1]
+    condensed = scipy.spatial.distance.squareform(matrix, checks=False)
     # Let's do the checks ourselves, because scipy checks for exact symmetry,
     # which we won't achieve due to rounding errors.
-    assert np.isclose(matrix - matrix.T, 0).all()
+    # We compare the matrix to its transpose in blocks of rows, so that the
+    # temporary arrays stay small (block_size x n instead of n x n).
+    block_size = 256
+    for start in range(0, len(matrix), block_size):
+        block = matrix[start : start + block_size]
+        deviation = block - matrix[:, start : start + block_size].T
+        assert (np.abs(deviation, out=deviation) <= 1e-8).all()
     assert np.isclose(np.diag(matrix), 0.0).all()
-    return scipy.spatial.distance.squareform(matrix, checks=False)
+    return condensed
 
 
 def uncondense_distance_matrix(vector):
@@ -16,13 +16,12 @@ def cov2err(cov):
     Returns
         [n x ] nbins array
     """
-    cov = np.array(cov)
-    if cov.ndim == 2:
-        return np.sqrt(cov.diagonal())
-    elif cov.ndim == 3:
-        return np.sqrt(cov.diagonal(axis1=1, axis2=2))
-    else:
+    # No need to copy the whole array, we only read its diagonal(s)
+    cov = np.asarray(cov)
+    if cov.ndim not in [2, 3]:
         raise ValueError("Wrong dimensions.")
+    # einsum returns a view on the diagonal(s)
+    return np.sqrt(np.einsum("...ii->...i", cov))
 
 
 def cov2corr(cov):
@@ -60,9 +59,9 @@ def corr2cov(corr, err):
     corr = np.array(corr)
     err = np.array(err)
     if corr.ndim == 2:
-        return np.einsum("ij,i,j->ij", corr, err, err)
+        return corr * np.outer(err, err)
     elif corr.ndim == 3:
-        return np.einsum("kij,ki,kj->kij", corr, err, err)
+        return corr * err[:, :, np.newaxis] * err[:, np.newaxis, :]
     else:
         raise ValueError("Wrong dimensions")
 
@@ -81,9 +80,9 @@ def rel2abs_cov(cov, data):
     data = np.array(data)
     assert cov.ndim == data.ndim + 1
     if data.ndim == 1:
-        return np.einsum("ij,i,j->ij", cov, data, data)
+        return cov * np.outer(data, data)
     elif data.ndim == 2:
-        return np.einsum("kij,ki,kj->kij", cov, data, data)
+        return cov * data[:, :, np.newaxis] * data[:, np.newaxis, :]
     else:
         raise ValueError("Wrong dimensions")
 
@@ -102,10 +101,8 @@ def abs2rel_cov(cov, data):
     data = np.array(data)
     assert cov.ndim == data.ndim + 1
     if data.ndim == 1:
-        nbins = len(data)
-        return cov / data.reshape((nbins, 1)) / data.reshape((1, nbins))
+        return cov / np.outer(data, data)
     elif data.ndim == 2:
-        n, nbins = data.shape
-        return cov / data.reshape((n, nbins, 1)) / data.reshape((n, 1, nbins))
+        return cov / (data[:, :, np.newaxis] * data[:, np.newaxis, :])
     else:
         raise ValueError("Wrong dimensions")
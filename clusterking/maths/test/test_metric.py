@@ -8,9 +8,12 @@ import pytest
 import numpy as np
 import scipy.stats
 import scipy.spatial
+import pandas as pd
 
 # ours
-from clusterking.maths.metric import chi2
+from clusterking.maths.metric import chi2, chi2_metric
+from clusterking.maths.metric_utils import condense_distance_matrix
+from clusterking.data.dwe import DataWithErrors
 
 
 _metrics_to_test = [
@@ -83,6 +86,89 @@ def test_metric_symmetric(metric):
         assert np.isclose(chi2s1, chi2s2).all()
 
 
+def _random_dwe(n_obs, n_bins) -> DataWithErrors:
+    dwe = DataWithErrors()
+    dwe.df = pd.DataFrame(
+        1 + np.random.random(size=(n_obs, n_bins)),
+        columns=["bin{}".format(i) for i in range(n_bins)],
+    )
+    dwe.reset_errors()
+    return dwe
+
+
+def _chi2_metric_reference(dwe: DataWithErrors) -> np.ndarray:
+    """Straightforward pair by pair implementation of the chi2 metric
+    (full distance matrix).
+    """
+    d = dwe.data()
+    cov = dwe.cov()
+    n_obs, n_bins = d.shape
+    ret = np.zeros((n_obs, n_obs))
+    for i in range(n_obs):
+        for j in range(n_obs):
+            ret[i, j] = chi2(
+                d[i : i + 1], d[j], cov[i], cov[j], normalize=True
+            )[0]
+    return ret / (n_bins - 1)
+
+
+def test_chi2_metric():
+    n_obs = 12
+    n_bins = 5
+    dwe = _random_dwe(n_obs, n_bins)
+    dwe.add_err_poisson(100)
+    dwe.add_rel_err_corr(0.1, random_correlation_matrix(n_bins))
+    dwe.add_err_uncorr(0.01)
+    reference = _chi2_metric_reference(dwe)
+    full = chi2_metric(dwe, output="full")
+    assert full.shape == (n_obs, n_obs)
+    assert np.isclose(full, reference).all()
+    assert np.isclose(
+        chi2_metric(dwe), condense_distance_matrix(reference)
+    ).all()
+    # Chunks that don't divide the number of pairs
+    assert np.isclose(
+        chi2_metric(dwe, chunk_size=7), condense_distance_matrix(reference)
+    ).all()
+
+
+def test_chi2_metric_float32():
+    dwe = _random_dwe(12, 5)
+    dwe.add_err_poisson(100)
+    dwe.add_rel_err_uncorr(0.1)
+    chi2s = chi2_metric(dwe, dtype=np.float32)
+    assert chi2s.dtype == np.float32
+    assert np.isclose(chi2s, chi2_metric(dwe), rtol=1e-4).all()
+
+
+def test_chi2_metric_float32_constant_cov():
+    # Very similar distributions with small errors, so that chi2/ndf ~ 1
+    n_obs = 200
+    n_bins = 20
+    base = 1 + np.random.random(size=n_bins)
+    dwe = _random_dwe(n_obs, n_bins)
+    dwe.df[dwe.bin_cols] = base * (
+        1 + 1e-3 * np.random.normal(size=(n_obs, n_bins))
+    )
+    dwe.df[dwe.bin_cols] = dwe.data(normalize=True)
+    dwe.add_err_uncorr(1e-3 * dwe.data().mean())
+    chi2s = chi2_metric(dwe, dtype=np.float32)
+    assert chi2s.dtype == np.float32
+    assert np.isclose(chi2s, chi2_metric(dwe), rtol=1e-3).all()
+
+
+def test_chi2_metric_constant_cov():
+    n_obs = 12
+    n_bins = 5
+    dwe = _random_dwe(n_obs, n_bins)
+    # With equal normalizations and only absolute errors, all normalized
+    # covariance matrices are identical
+    dwe.df[dwe.bin_cols] = dwe.data(normalize=True)
+    dwe.add_err_corr(0.05, random_correlation_matrix(n_bins))
+    reference = _chi2_metric_reference(dwe)
+    assert np.isclose(chi2_metric(dwe, output="full"), reference).all()
+
+
 def generate_toy_dataset(
     base_hist: np.ndarray, cov: np.ndarray, n_toys=1000
 ) -> np.ndarray:
@@ -26,5 +26,5 @@ from clusterking.util.matplotlib_utils import import_matplotlib
 import_matplotlib()
 from clusterking.plots.plot_bundles import BundlePlot
 from clusterking.plots.plot_clusters import ClusterPlot
-from clusterking.plots.plot_histogram import plot_histogram
+from clusterking.plots.plot_histogram import plot_histogram, plot_histograms
 from clusterking.plots.colors import ColorScheme
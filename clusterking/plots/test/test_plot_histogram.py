@@ -7,7 +7,11 @@ import unittest
 import numpy as np
 
 # ours
-from clusterking.plots.plot_histogram import plot_hist_with_mean
+from clusterking.plots.plot_histogram import (
+    plot_hist_with_mean,
+    plot_histogram,
+    plot_histograms,
+)
 
 
 class TestPlotHistWithMean(unittest.TestCase):
@@ -15,5 +19,50 @@ class TestPlotHistWithMean(unittest.TestCase):
         plot_hist_with_mean(np.random.normal(size=100))
 
 
+class TestPlotHistogram(unittest.TestCase):
+    def test(self):
+        ax = plot_histogram(None, [0.0, 1.0, 2.0, 4.0], [1, 2, 3])
+        np.testing.assert_allclose(ax.lines[0].get_xdata(), [0, 1, 1, 2, 2, 4])
+        np.testing.assert_allclose(ax.lines[0].get_ydata(), [1, 1, 2, 2, 3, 3])
+
+    def test_where(self):
+        ax = plot_histogram(None, None, [1, 2, 3], where="post")
+        np.testing.assert_allclose(ax.lines[0].get_ydata(), [1, 1, 2, 2, 3, 3])
+        with self.assertRaises(ValueError):
+            plot_histogram(None, None, [1, 2, 3], where="mid")
+
+    def test_normalize(self):
+        edges = [0.0, 1.0, 2.0, 4.0]
+        ax = plot_histogram(None, edges, [1, 2, 3], normalize=True)
+        heights = ax.lines[0].get_ydata()[::2]
+        self.assertAlmostEqual(np.dot(heights, np.diff(edges)), 1.0)
+
+
+class TestPlotHistograms(unittest.TestCase):
+    def test(self):
+        contents = np.array([[1.0, 2.0, 3.0], [2.0, 2.0, 4.0]])
+        ax = plot_histograms(None, [0.0, 1.0, 2.0, 4.0], contents)
+        self.assertEqual(len(ax.collections), 1)
+        segments = ax.collections[0].get_segments()
+        self.assertEqual(len(segments), 2)
+        np.testing.assert_allclose(
+            segments[0],
+            [[0, 1], [1, 1], [1, 2], [2, 2], [2, 3], [4, 3]],
+        )
+
+    def test_normalize(self):
+        contents = np.array([[1.0, 2.0, 3.0], [2.0, 2.0, 4.0]])
+        edges = [0.0, 1.0, 2.0, 4.0]
+        ax = plot_histograms(None, edges, contents, normalize=True)
+        for segment in ax.collections[0].get_segments():
+            heights = segment[::2, 1]
+            self.assertAlmostEqual(np.dot(heights, np.diff(edges)), 1.0)
+
+    def test_no_edges(self):
+        ax = plot_histograms(None, None, np.ones((3, 4)))
+        segments = ax.collections[0].get_segments()
+        self.assertEqual(segments[0][-1, 0], 4)
+
+
 if __name__ == "__main__":
     unittest.main()